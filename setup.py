@@ -0,0 +1,16 @@
+"""
+Build the optional Cython extension used by task_3.py.
+
+Requires Cython, which is not part of requirements.txt:
+
+    pip install Cython
+    python setup.py build_ext --inplace
+"""
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+setup(
+    ext_modules=cythonize(
+        [Extension('task_3_bm', ['task_3_bm.pyx'], extra_compile_args=['-O3', '-march=native'])],
+    ),
+)
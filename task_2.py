@@ -1,7 +1,47 @@
+from array import array
+
+import numpy as np
+from numba import njit
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _binary_search_nb(arr, target):
+    """
+    Branchless lower-bound search over a contiguous float64 array.
+    
+    The loop trip count depends only on the array length, and the
+    comparison result is folded into the offset arithmetically, so the
+    body compiles to a conditional move instead of a branch.
+    
+    Returns:
+        A tuple of the index of the first element greater than or equal
+        to the target (len(arr) if there is none) and the number of
+        iterations.
+    """
+    n = len(arr)
+    if n == 0:
+        return 0, 0
+    
+    iterations = 0
+    lo = 0
+    while n > 1:
+        iterations += 1
+        half = n >> 1
+        lo += (arr[lo + half - 1] < target) * half
+        n -= half
+    
+    # The loop narrows down to one candidate which may still be too small
+    iterations += 1
+    lo += arr[lo] < target
+    return lo, iterations
+
 def binary_search(arr, target):
     """
     Perform binary search on a sorted array of floating point numbers.
     
+    Pass a contiguous ``np.float64`` array or an ``array.array('d')`` to
+    avoid re-converting the input on every call; both are used in place
+    through the buffer protocol.
+    
     Args:
         arr: A sorted array of floating point numbers.
         target: The value to search for.
@@ -11,31 +51,136 @@ def binary_search(arr, target):
         and the second element is the upper bound (smallest element
         greater than or equal to the target value).
     """
-    iterations = 0
+    arr_np = np.ascontiguousarray(arr, dtype=np.float64)
+    idx, iterations = _binary_search_nb(arr_np, float(target))
+    
+    # If the index is past the end, no upper bound exists
+    if idx < arr_np.size:
+        return (iterations, float(arr_np[idx]))
+    else:
+        return (iterations, None)
+
+def build_eytzinger(arr_sorted):
+    """
+    Reorder a sorted array into Eytzinger (BFS) layout.
+    
+    The result is 1-indexed: the root lives at index 1 and the children
+    of node k at 2k and 2k + 1, so a search walks forward through memory
+    and the top levels of the tree share a few cache lines.
     
-    left = 0
-    right = len(arr) - 1
+    Args:
+        arr_sorted: A sorted array of floating point numbers.
+    
+    Returns:
+        A float64 array of length len(arr_sorted) + 1 (index 0 is unused).
+    """
+    src = np.asarray(arr_sorted, dtype=np.float64)
+    n = src.size
+    eyt = np.zeros(n + 1, dtype=np.float64)
     
-    while left <= right:
+    # An in-order walk of the implicit tree visits the nodes in sorted order
+    def fill(j, k):
+        if k <= n:
+            j = fill(j, 2 * k)
+            eyt[k] = src[j]
+            j += 1
+            j = fill(j, 2 * k + 1)
+        return j
+    
+    fill(0, 1)
+    return eyt
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _eytzinger_search_nb(eyt, target):
+    """
+    Lower-bound search over an array in Eytzinger layout.
+    
+    Returns:
+        A tuple of the index in eyt of the first element greater than or
+        equal to the target (0 if there is none) and the number of
+        iterations.
+    """
+    n = len(eyt) - 1
+    iterations = 0
+    k = 1
+    while k <= n:
         iterations += 1
-        mid = (left + right) // 2
-        
-        if arr[mid] == target:
-            return (iterations, arr[mid])
-        elif arr[mid] < target:
-            left = mid + 1
-        else:  # arr[mid] > target
-            right = mid - 1
-    
-    # If the element was not found, return the upper bound
-    if left < len(arr):
-        return (iterations, arr[left])
+        k = 2 * k + (eyt[k] < target)
+    
+    # Each right turn appended a 1 bit; strip them and the last left turn
+    # to get back to the node where the answer was found
+    while k & 1:
+        k >>= 1
+    k >>= 1
+    return k, iterations
+
+def eytzinger_search(eyt, target):
+    """
+    Perform binary search on an array built by build_eytzinger.
+    
+    Args:
+        eyt: An array in Eytzinger layout.
+        target: The value to search for.
+    
+    Returns:
+        A tuple where the first element is the number of iterations,
+        and the second element is the upper bound (smallest element
+        greater than or equal to the target value).
+    """
+    k, iterations = _eytzinger_search_nb(eyt, float(target))
+    
+    if k > 0:
+        return (iterations, float(eyt[k]))
     else:
-        return (iterations, None)  # No upper bound exists
+        return (iterations, None)
+
+def compile_bsearch(arr_sorted):
+    """
+    Generate a binary search specialized to a fixed sorted array.
+    
+    The values are baked into the source of a nested if/else cascade, so
+    a lookup is a straight chain of comparisons against constants with no
+    loop and no indexing.
+    
+    Args:
+        arr_sorted: A sorted array of floating point numbers.
+    
+    Returns:
+        A function taking the target value and returning a tuple where the
+        first element is the number of iterations, and the second element
+        is the upper bound (smallest element greater than or equal to the
+        target value).
+    """
+    values = [float(value) for value in arr_sorted]
+    lines = ["def search(t):"]
+    
+    def emit(lo, hi, upper_bound, depth):
+        indent = " " * (depth + 1)
+        if lo >= hi:
+            lines.append(f"{indent}return ({depth}, {upper_bound!r})")
+            return
+        
+        mid = (lo + hi) // 2
+        lines.append(f"{indent}if t <= {values[mid]!r}:")
+        emit(lo, mid, values[mid], depth + 1)
+        lines.append(f"{indent}else:")
+        emit(mid + 1, hi, upper_bound, depth + 1)
+    
+    emit(0, len(values), None, 0)
+    
+    # repr() of an infinite float is a bare name, so make it resolvable
+    namespace = {"inf": float("inf"), "nan": float("nan")}
+    exec("\n".join(lines), namespace)
+    return namespace["search"]
+
+# Compile the kernels at import time rather than on the first search
+_binary_search_nb(np.zeros(1, dtype=np.float64), 0.0)
+_eytzinger_search_nb(np.zeros(2, dtype=np.float64), 0.0)
 
 # Test cases
 if __name__ == "__main__":
-    arr = [0.1, 1.2, 2.3, 3.4, 4.5, 5.6, 6.7, 7.8, 8.9, 9.0]
+    # Store unboxed doubles so repeated searches don't copy the list each time
+    arr = array('d', [0.1, 1.2, 2.3, 3.4, 4.5, 5.6, 6.7, 7.8, 8.9, 9.0])
     
     # Test case 1: Element exists in the array
     print(binary_search(arr, 4.5))  # Should return the element with iterations
@@ -48,3 +193,17 @@ if __name__ == "__main__":
     
     # Test case 4: Element is greater than all elements in the array
     print(binary_search(arr, 10.0))  # Should return None as upper bound
+    
+    # The same searches over the Eytzinger layout
+    eyt = build_eytzinger(arr)
+    print(eytzinger_search(eyt, 4.5))   # Should return 4.5
+    print(eytzinger_search(eyt, 4.0))   # Should return 4.5
+    print(eytzinger_search(eyt, 0.0))   # Should return 0.1
+    print(eytzinger_search(eyt, 10.0))  # Should return None
+    
+    # The same searches with a function specialized to this array
+    search = compile_bsearch(arr)
+    print(search(4.5))   # Should return 4.5
+    print(search(4.0))   # Should return 4.5
+    print(search(0.0))   # Should return 0.1
+    print(search(10.0))  # Should return None
@@ -0,0 +1,63 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Boyer-Moore string search compiled to C with Cython.
+
+Build in place with: python setup.py build_ext --inplace
+"""
+
+def boyer_moore_c_search(text, pattern):
+    """
+    Implementation of the Boyer-Moore string searching algorithm in C.
+    """
+    cdef bint text_is_str = isinstance(text, str)
+    if text_is_str:
+        text = text.encode('utf-8', 'surrogatepass')
+    if isinstance(pattern, str):
+        pattern = pattern.encode('utf-8', 'surrogatepass')
+    
+    # Bytes-like inputs (bytes, bytearray, mmap, ...) are read in place
+    cdef const unsigned char[:] t = text
+    cdef const unsigned char[:] p = pattern
+    cdef Py_ssize_t text_length = t.shape[0]
+    cdef Py_ssize_t pattern_length = p.shape[0]
+    cdef Py_ssize_t shift_table[256]
+    cdef Py_ssize_t i, j, k, position
+    
+    if pattern_length > text_length:
+        return -1
+    
+    if pattern_length == 0:
+        return 0
+    
+    # Build the shift table
+    for i in range(256):
+        shift_table[i] = pattern_length
+    for i in range(pattern_length - 1):
+        shift_table[p[i]] = pattern_length - i - 1
+    
+    # Start from the end of the pattern
+    i = pattern_length - 1
+    
+    while i < text_length:
+        j = pattern_length - 1
+        k = i
+        
+        # Compare bytes from right to left
+        while j >= 0 and t[k] == p[j]:
+            j -= 1
+            k -= 1
+        
+        if j == -1:  # Pattern found
+            if not text_is_str:
+                return k + 1
+            # Count the bytes that start a character (not 10xxxxxx) before the match
+            position = 0
+            for i in range(k + 1):
+                if (t[i] & 0xC0) != 0x80:
+                    position += 1
+            return position
+        
+        # Shift the pattern
+        i += shift_table[t[k]]
+    
+    return -1  # Pattern not found